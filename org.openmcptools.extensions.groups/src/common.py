@@ -1,19 +1,36 @@
+from __future__ import annotations
+
 import abc
-from typing import List, Any, Dict, TypeVar, Generic, Callable
+import sys
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Iterable, Sequence, TypeVar
+
+from enum import IntEnum
 
-from enum import Enum
+class Role(IntEnum):
+    # values start at 1 so every role is truthy
+    USER = 1
+    ASSISTANT = 2
 
-class Role(Enum):
-    USER = "USER"
-    ASSISTANT = "ASSISTANT"
+def _index_identity(items: list[Any], item: Any) -> int:
+    for i, e in enumerate(items):
+        if e is item:
+            return i
+    return -1
 
+def _values(items: dict[int, Any] | None) -> list[Any]:
+    return [] if items is None else list(items.values())
+
+@dataclass(slots=True, eq=False, repr=False)
 class Icon:
-    
-    def __init__(self, src: str, mime_type: str = None, sizes: List[str] = None):
-        self.str = src
-        self.mime_type = mime_type
-        self.sizes = sizes
-        
+    src: str
+    mime_type: str | None = None
+    sizes: Sequence[str] = ()
+
+    def __post_init__(self):
+        if self.sizes is None:
+            self.sizes = ()
+
     def get_src(self) -> str:
         return self.src
 
@@ -26,25 +43,31 @@ class Icon:
     def set_mime_type(self, mime_type: str):
         self.mime_type = mime_type
 
-    def get_sizes(self) -> List[str]:
+    def get_sizes(self) -> Sequence[str]:
+        """Unset sizes are a shared empty tuple; do not mutate the result in place."""
         return self.sizes
 
-    def set_sizes(self, sizes: List[str]):
-        self.sizes = sizes
+    def set_sizes(self, sizes: Sequence[str] | None):
+        self.sizes = sizes or ()
 
     def __str__(self) -> str:
         return f"Icon [src={self.src}, mimeType={self.mime_type}, sizes={self.sizes}]"
 
+@dataclass(slots=True, eq=False, repr=False)
 class Annotations:
-    def __init__(self, audience: List[Role] = None, priority: float = None):
-        self.audience = audience
-        self.priority = priority
+    audience: Sequence[Role] = ()
+    priority: float | None = None
+
+    def __post_init__(self):
+        if self.audience is None:
+            self.audience = ()
 
-    def get_audience(self) -> List[Role]:
+    def get_audience(self) -> Sequence[Role]:
+        """An unset audience is a shared empty tuple; do not mutate the result in place."""
         return self.audience
 
-    def set_audience(self, audience: List[Role]):
-        self.audience = audience
+    def set_audience(self, audience: Sequence[Role] | None):
+        self.audience = audience or ()
 
     def get_priority(self) -> float:
         return self.priority
@@ -55,21 +78,22 @@ class Annotations:
     def __str__(self) -> str:
         return f"Annotations [audience={self.audience}, priority={self.priority}]"
 
-class AbstractBase(abc.ABC):
+class AbstractBase:
+    # name and name_separator are fixed at construction: groups cache their
+    # fully qualified name and do not watch these fields for changes
+    __slots__ = ('name', 'name_separator', 'title', 'description', 'icons', 'meta')
+
     DEFAULT_SEPARATOR = "."
 
-    def __init__(self, name: str, name_separator = None, title: str = None, description: str = None, icons: List[Icon] = None, meta: dict[str,Any] = None):
+    def __init__(self, name: str, name_separator: str | None = None, title: str | None = None, description: str | None = None, icons: Sequence[Icon] | None = None, meta: dict[str, Any] | None = None):
         # Validation for 'name' parameter
         if name is None or len(name) == 0 or name.isspace():
             raise ValueError("name must not be null, empty, or blank")
-        self.name = name
-        if (name_separator):
-            self.name_separator = name_separator
-        else:
-            self.name_separator = AbstractBase.DEFAULT_SEPARATOR
+        self.name = sys.intern(name)
+        self.name_separator = name_separator or AbstractBase.DEFAULT_SEPARATOR
         self.title = title
         self.description = description
-        self.icons = icons
+        self.icons = icons or ()
         self.meta = meta
 
     def get_name_separator(self):
@@ -90,179 +114,311 @@ class AbstractBase(abc.ABC):
     def set_description(self, description: str):
         self.description = description
 
-    def get_icons(self) -> List[Icon]:
+    def get_icons(self) -> Sequence[Icon]:
+        """Unset icons are a shared empty tuple; do not mutate the result in place."""
         return self.icons
 
-    def set_icons(self, icons: List[Icon]):
-        self.icons = icons
+    def set_icons(self, icons: Sequence[Icon] | None):
+        self.icons = icons or ()
 
-    def get_meta(self) -> Dict[str, Any]:
+    def get_meta(self) -> dict[str, Any]:
         return self.meta
 
-    def set_meta(self, meta: Dict[str, Any]):
+    def set_meta(self, meta: dict[str, Any]):
         self.meta = meta
 
-    @abc.abstractmethod
     def get_fully_qualified_name(self) -> str:
-        pass
+        raise NotImplementedError
 
 class Group(AbstractBase):
-    def __init__(self, name: str, name_separator: str = AbstractBase.DEFAULT_SEPARATOR, title: str = None, description: str = None, icons: List[Icon] = None, meta: Dict[str,Any] = None):
-        super().__init__(name, name_separator, title, description, icons, meta)
-        self.parent = None
-        self.child_groups = []
-        self.child_tools = []
-        self.child_prompts = []
-        self.child_resources = []
+    __slots__ = ('_parent', '_child_groups', '_child_tools', '_child_prompts', '_child_resources', '_fqn')
 
-    def get_parent(self) -> 'Group':
-        return self.parent
-
-    def set_parent(self, parent: 'Group'):
+    def __init__(self, name: str, name_separator: str = AbstractBase.DEFAULT_SEPARATOR, title: str | None = None, description: str | None = None, icons: Sequence[Icon] | None = None, meta: dict[str, Any] | None = None):
+        super().__init__(name, name_separator, title, description, icons, meta)
+        self._parent = None
+        # children are keyed by id() so add/remove/contains are O(1) while
+        # the dicts keep insertion order; each dict is only created when
+        # the first child of that kind is added
+        self._child_groups = None
+        self._child_tools = None
+        self._child_prompts = None
+        self._child_resources = None
+        self._fqn = None
+
+    @property
+    def parent(self) -> Group:
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent: Group):
+        # move this group between the parents' child_groups so that
+        # re-parenting an ancestor still reaches its cached name
+        old_parent = self._parent
+        if old_parent is not parent:
+            if old_parent is not None and old_parent._child_groups:
+                old_parent._child_groups.pop(id(self), None)
+            if parent is not None:
+                children = parent._child_groups
+                if children is None:
+                    children = parent._child_groups = {}
+                children[id(self)] = self
+        self._parent = parent
+        self._invalidate_fully_qualified_name()
+
+    def get_parent(self) -> Group:
+        return self._parent
+
+    def set_parent(self, parent: Group):
         self.parent = parent
 
-    def get_root(self) -> 'Group':
-        parent = self.parent
-        if parent is None:
-            return self
-        else:
-            return parent.get_root()
+    def get_root(self) -> Group:
+        node = self
+        parent = node._parent
+        while parent is not None:
+            node = parent
+            parent = node._parent
+        return node
 
     def is_root(self) -> bool:
-        return self.parent is None
-
-    def add_child_group(self, child_group: 'Group') -> bool:
-        if child_group in self.child_groups:
+        return self._parent is None
+
+    def add_child_group(self, child_group: Group) -> bool:
+        children = self._child_groups
+        if children is None:
+            children = self._child_groups = {}
+        key = id(child_group)
+        if key in children:
             return False
-        self.child_groups.append(child_group)
-        child_group.parent = self
+        children[key] = child_group
+        child_group._parent = self
+        child_group._invalidate_fully_qualified_name()
         return True
 
-    def remove_child_group(self, child_group: 'Group') -> bool:
-        if child_group in self.child_groups:
-            self.child_groups.remove(child_group)
-            child_group.parent = None
-            return True
-        return False
-
-    def get_child_groups(self) -> List['Group']:
-        return self.child_groups
+    def remove_child_group(self, child_group: Group) -> bool:
+        children = self._child_groups
+        if children is None or children.pop(id(child_group), None) is None:
+            return False
+        child_group._parent = None
+        child_group._invalidate_fully_qualified_name()
+        return True
 
-    def add_child_tool(self, child_tool: 'Tool') -> bool:
-        if child_tool in self.child_tools:
+    def add_child_groups(self, child_groups: Iterable[Group]) -> int:
+        children = self._child_groups
+        if children is None:
+            children = self._child_groups = {}
+        added = 0
+        for child_group in child_groups:
+            key = id(child_group)
+            if key not in children:
+                children[key] = child_group
+                child_group._parent = self
+                child_group._invalidate_fully_qualified_name()
+                added += 1
+        return added
+
+    @property
+    def child_groups(self) -> list[Group]:
+        return _values(self._child_groups)
+
+    def get_child_groups(self) -> list[Group]:
+        return _values(self._child_groups)
+
+    def add_child_tool(self, child_tool: Tool) -> bool:
+        children = self._child_tools
+        if children is None:
+            children = self._child_tools = {}
+        key = id(child_tool)
+        if key in children:
             return False
-        self.child_tools.append(child_tool)
+        children[key] = child_tool
         child_tool.add_parent_group(self)
         return True
 
-    def remove_child_tool(self, child_tool: 'Tool') -> bool:
-        if child_tool in self.child_tools:
-            self.child_tools.remove(child_tool)
-            child_tool.remove_parent_group(self)
-            return True
-        return False
+    def remove_child_tool(self, child_tool: Tool) -> bool:
+        children = self._child_tools
+        if children is None or children.pop(id(child_tool), None) is None:
+            return False
+        child_tool.remove_parent_group(self)
+        return True
+
+    def add_child_tools(self, child_tools: Iterable[Tool]) -> int:
+        if self._child_tools is None:
+            self._child_tools = {}
+        return self._add_leaves(self._child_tools, child_tools)
 
-    def get_child_tools(self) -> List['Tool']:
-        return self.child_tools
+    @property
+    def child_tools(self) -> list[Tool]:
+        return _values(self._child_tools)
 
-    def add_child_prompt(self, child_prompt: 'Prompt') -> bool:
-        if child_prompt in self.child_prompts:
+    def get_child_tools(self) -> list[Tool]:
+        return _values(self._child_tools)
+
+    def add_child_prompt(self, child_prompt: Prompt) -> bool:
+        children = self._child_prompts
+        if children is None:
+            children = self._child_prompts = {}
+        key = id(child_prompt)
+        if key in children:
             return False
-        self.child_prompts.append(child_prompt)
+        children[key] = child_prompt
         child_prompt.add_parent_group(self)
         return True
 
-    def remove_child_prompt(self, child_prompt: 'Prompt') -> bool:
-        if child_prompt in self.child_prompts:
-            self.child_prompts.remove(child_prompt)
-            child_prompt.remove_parent_group(self)
-            return True
-        return False
+    def remove_child_prompt(self, child_prompt: Prompt) -> bool:
+        children = self._child_prompts
+        if children is None or children.pop(id(child_prompt), None) is None:
+            return False
+        child_prompt.remove_parent_group(self)
+        return True
+
+    def add_child_prompts(self, child_prompts: Iterable[Prompt]) -> int:
+        if self._child_prompts is None:
+            self._child_prompts = {}
+        return self._add_leaves(self._child_prompts, child_prompts)
+
+    @property
+    def child_prompts(self) -> list[Prompt]:
+        return _values(self._child_prompts)
 
-    def get_child_resources(self) -> List['Resource']:
-        return self.child_resources
+    def get_child_prompts(self) -> list[Prompt]:
+        return _values(self._child_prompts)
 
-    def add_child_resource(self, child_resource: 'Resource') -> bool:
-        if child_resource in self.child_resources:
+    def add_child_resource(self, child_resource: Resource) -> bool:
+        children = self._child_resources
+        if children is None:
+            children = self._child_resources = {}
+        key = id(child_resource)
+        if key in children:
             return False
-        self.child_resources.append(child_resource)
+        children[key] = child_resource
         child_resource.add_parent_group(self)
         return True
 
-    def remove_child_resource(self, child_resource: 'Resource') -> bool:
-        if child_resource in self.child_resources:
-            self.child_resources.remove(child_resource)
-            child_resource.remove_parent_group(self)
-            return True
-        return False
-
-    def get_child_prompts(self) -> List['Prompt']:
-        return self.child_prompts
+    def remove_child_resource(self, child_resource: Resource) -> bool:
+        children = self._child_resources
+        if children is None or children.pop(id(child_resource), None) is None:
+            return False
+        child_resource.remove_parent_group(self)
+        return True
 
-    def _get_fq_name_recursive(self, tg: 'Group') -> str:
-        parent = tg.get_parent()
-        if parent is not None:
-            parent_name = self._get_fq_name_recursive(parent)
-            return parent_name + self.name_separator + tg.get_name()
-        return tg.get_name()
+    def add_child_resources(self, child_resources: Iterable[Resource]) -> int:
+        if self._child_resources is None:
+            self._child_resources = {}
+        return self._add_leaves(self._child_resources, child_resources)
+
+    @property
+    def child_resources(self) -> list[Resource]:
+        return _values(self._child_resources)
+
+    def get_child_resources(self) -> list[Resource]:
+        return _values(self._child_resources)
+
+    def _add_leaves(self, children: dict[int, AbstractLeaf], leaves: Iterable[AbstractLeaf]) -> int:
+        added = 0
+        for leaf in leaves:
+            key = id(leaf)
+            if key not in children:
+                children[key] = leaf
+                leaf.add_parent_group(self)
+                added += 1
+        return added
+
+    def _invalidate_fully_qualified_name(self):
+        # a group's fully qualified name depends on its ancestors, so a
+        # re-parented group takes its whole subtree's cached names with it
+        groups = [self]
+        pop = groups.pop
+        extend = groups.extend
+        while groups:
+            group = pop()
+            group._fqn = None
+            children = group._child_groups
+            if children:
+                extend(children.values())
 
     def get_fully_qualified_name(self) -> str:
-        return self._get_fq_name_recursive(self)
+        fqn = self._fqn
+        if fqn is None:
+            parent = self._parent
+            if parent is None:
+                fqn = self.name
+            else:
+                names = [self.name]
+                append = names.append
+                while parent is not None:
+                    append(parent.name)
+                    parent = parent._parent
+                names.reverse()
+                fqn = self.name_separator.join(names)
+            self._fqn = fqn
+        return fqn
 
     def __str__(self) -> str:
-        return f"Group [name={self.name}, fqName={self.get_fully_qualified_name()}, isRoot={self.is_root()}, title={self.title}, description={self.description}, meta={self.meta}, childGroups={self.child_groups}, childTools={self.child_tools}, childPrompts={self.child_prompts}]"
+        # children are reported as counts; formatting every child on each
+        # call made logging a group O(number of children)
+        return f"Group [name={self.name}, fqName={self.get_fully_qualified_name()}, isRoot={self._parent is None}, title={self.title}, description={self.description}, meta={self.meta}, childGroups={len(self._child_groups or ())}, childTools={len(self._child_tools or ())}, childPrompts={len(self._child_prompts or ())}, childResources={len(self._child_resources or ())}]"
 
 class AbstractLeaf(AbstractBase):
-    def __init__(self, name: str, name_separator: str = None, title: str = None, description: str = None, icons: List[Icon] = None, meta: Dict[str,Any] = None):
+    __slots__ = ('_parent_groups', 'primary_parent_group_index')
+
+    def __init__(self, name: str, name_separator: str | None = None, title: str | None = None, description: str | None = None, icons: Sequence[Icon] | None = None, meta: dict[str, Any] | None = None):
         super().__init__(name, name_separator, title, description, icons, meta)
-        self.parent_groups = []
+        # most leaves belong to no group or only a few, so the list is
+        # created by the first add_parent_group
+        self._parent_groups = None
         self.primary_parent_group_index = -1
 
     def add_parent_group(self, parent_group: Group) -> bool:
         if parent_group is None:
             raise ValueError("parentGroup must not be none")
-        if parent_group in self.parent_groups:
+        parent_groups = self._parent_groups
+        if parent_groups is None:
+            parent_groups = self._parent_groups = []
+        elif parent_group in parent_groups:
             return False
-        self.parent_groups.append(parent_group)
+        parent_groups.append(parent_group)
         if self.primary_parent_group_index == -1:
             self.primary_parent_group_index = 0
         return True
 
     def remove_parent_group(self, parent_group: Group) -> bool:
-        try:
-            current_index = self.parent_groups.index(parent_group)
-        except ValueError:
+        parent_groups = self._parent_groups
+        if parent_groups is None:
             return False
-
+        current_index = _index_identity(parent_groups, parent_group)
+        if current_index == -1:
+            return False
+        del parent_groups[current_index]
         if current_index == self.primary_parent_group_index:
-            self.parent_groups.pop(current_index)
             self.primary_parent_group_index = -1
-            return True
-        self.parent_groups.remove(parent_group)
         return True
 
-    def get_parent_groups(self) -> List[Group]:
-        return self.parent_groups
+    # like Group.get_child_*, these return a new list; membership changes
+    # go through add_parent_group/remove_parent_group
+    @property
+    def parent_groups(self) -> list[Group]:
+        return list(self._parent_groups or ())
 
-    def get_parent_group_roots(self) -> List[Group]:
-        return [g.get_root() for g in self.parent_groups]
+    def get_parent_groups(self) -> list[Group]:
+        return list(self._parent_groups or ())
 
-    def _get_primary_parent_name(self) -> str:
-        return self.parent_groups[self.primary_parent_group_index].get_fully_qualified_name() \
-            if self.primary_parent_group_index > -1 else None
+    def get_parent_group_roots(self) -> list[Group]:
+        return [g.get_root() for g in self._parent_groups or ()]
 
     def get_fully_qualified_name(self) -> str:
-        first_parent_name = self._get_primary_parent_name()
-        return self.name if first_parent_name is None else first_parent_name + self.name_separator + self.name
+        index = self.primary_parent_group_index
+        if index == -1:
+            return self.name
+        return f"{self._parent_groups[index].get_fully_qualified_name()}{self.name_separator}{self.name}"
 
+@dataclass(slots=True, eq=False, repr=False)
 class ToolAnnotations:
-    def __init__(self):
-        self.title = None
-        self.read_only_hint = None
-        self.destructive_hint = None
-        self.idempotent_hint = None
-        self.open_world_hint = None
-        self.return_direct = None
+    title: str | None = None
+    read_only_hint: bool | None = None
+    destructive_hint: bool | None = None
+    idempotent_hint: bool | None = None
+    open_world_hint: bool | None = None
+    return_direct: bool | None = None
 
     def get_title(self) -> str:
         return self.title
@@ -304,7 +460,9 @@ class ToolAnnotations:
         return f"ToolAnnotation [title={self.title}, readOnlyHint={self.read_only_hint}, destructiveHint={self.destructive_hint}, idempotentHint={self.idempotent_hint}, openWorldHint={self.open_world_hint}, returnDirect={self.return_direct}]"
 
 class Tool(AbstractLeaf):
-    def __init__(self, name: str, name_separator: str = None, title: str = None, description: str = None, icons: List[Icon] = None, meta: Dict[str, Any] = None):
+    __slots__ = ('input_schema', 'output_schema', 'tool_annotations')
+
+    def __init__(self, name: str, name_separator: str | None = None, title: str | None = None, description: str | None = None, icons: Sequence[Icon] | None = None, meta: dict[str, Any] | None = None):
         super().__init__(name, name_separator, title, description, icons, meta)
         self.input_schema = None
         self.output_schema = None
@@ -332,7 +490,9 @@ class Tool(AbstractLeaf):
         return f"Tool [name={self.name}, fqName={self.get_fully_qualified_name()}, title={self.title}, description={self.description}, meta={self.meta}, inputSchema={self.input_schema}, outputSchema={self.output_schema}, toolAnnotation={self.tool_annotations}]"
 
 class Resource(AbstractLeaf):
-    def __init__(self, name: str, uri: str, name_separator: str = None, title: str = None, description: str = None, mime_type: str = None, size: int = None, icons: list[Icon] = None, annotations: Annotations = None, meta: Dict[str, Any]  = None):
+    __slots__ = ('uri', 'mime_type', 'annotations', 'size')
+
+    def __init__(self, name: str, uri: str, name_separator: str | None = None, title: str | None = None, description: str | None = None, mime_type: str | None = None, size: int | None = None, icons: Sequence[Icon] | None = None, annotations: Annotations | None = None, meta: dict[str, Any] | None = None):
         super().__init__(name, name_separator, title, description, icons, meta)
         if uri is None:
             raise ValueError("uri must not be none")
@@ -350,14 +510,14 @@ class Resource(AbstractLeaf):
     def set_mime_type(self, mime_type: str):
         self.mime_type = mime_type
 
-    def get_annotations(self) -> Annotations:
+    def get_size(self) -> int:
         return self.size
 
     def set_size(self, size: int):
         self.size = size
 
-    def get_size(self) -> Annotations:
-        return self.size
+    def get_annotations(self) -> Annotations:
+        return self.annotations
 
     def set_annotations(self, annotations: Annotations):
         self.annotations = annotations
@@ -365,14 +525,18 @@ class Resource(AbstractLeaf):
     def __str__(self) -> str:
         return f"Resource [name={self.name}, fqName={self.get_fully_qualified_name()}, title={self.title}, description={self.description}, meta={self.meta}, uri={self.uri}, size={self.size}, mimeType={self.mime_type}, annotations={self.annotations}]"
 
-class PromptArgument():
-    def __init__(self, name: str, required: bool = False, description: str = None):
+@dataclass(slots=True, eq=False, repr=False)
+class PromptArgument:
+    name: str
+    required: bool = False
+    description: str | None = None
+
+    def __post_init__(self):
         # Validation for 'name' parameter
+        name = self.name
         if name is None or len(name) == 0 or name.isspace():
             raise ValueError("name must not be null, empty, or blank")
-        self.name = name
-        self.required = required
-        self.description = description
+        self.name = sys.intern(name)
 
     def get_name(self) -> str:
         return self.name
@@ -390,56 +554,68 @@ class PromptArgument():
         return self.required
 
     def __str__(self) -> str:
-        return f"PromptArgument [required={self.required}, name={self.name}, title={self.title}, description={self.description}, meta={self.meta}]"
+        return f"PromptArgument [required={self.required}, name={self.name}, description={self.description}]"
 
     def get_fully_qualified_name(self) -> str:
         return self.name
 
 class Prompt(AbstractLeaf):
-    def __init__(self, name: str, name_separator: str = None, title: str = None, description: str = None, arguments: List[PromptArgument] = None, icons: List[Icon] = None, meta: Dict[str, Any] = None):
+    __slots__ = ('_arguments',)
+
+    def __init__(self, name: str, name_separator: str | None = None, title: str | None = None, description: str | None = None, arguments: list[PromptArgument] | None = None, icons: Sequence[Icon] | None = None, meta: dict[str, Any] | None = None):
         super().__init__(name, name_separator, title, description, icons, meta)
-        if arguments:
-            self.arguments = arguments 
-        else:
-            self.arguments = []
+        self._arguments = arguments if arguments else None
 
-    def get_arguments(self) -> List[PromptArgument]:
-        return self.arguments
+    # a new list, as for parent_groups
+    @property
+    def arguments(self) -> list[PromptArgument]:
+        return list(self._arguments or ())
+
+    def get_arguments(self) -> list[PromptArgument]:
+        return list(self._arguments or ())
 
     def add_argument(self, argument: PromptArgument) -> bool:
         if argument is None:
             raise ValueError("argument must not be null")
-        if argument in self.arguments:
+        arguments = self._arguments
+        if arguments is None:
+            arguments = self._arguments = []
+        elif argument in arguments:
             return False
-        self.arguments.append(argument)
+        arguments.append(argument)
         return True
 
     def remove_argument(self, argument: PromptArgument) -> bool:
-        if argument in self.arguments:
-            self.arguments.remove(argument)
-            return True
-        return False
+        # arguments match by equality, as in add_argument
+        arguments = self._arguments
+        if arguments is None:
+            return False
+        try:
+            arguments.remove(argument)
+        except ValueError:
+            return False
+        return True
 
     def __str__(self) -> str:
-        return f"Prompt [promptArguments={self.prompt_arguments}, name={self.name}, fqName={self.get_fully_qualified_name()}, title={self.title}, description={self.description}, meta={self.meta}]"
+        return f"Prompt [promptArguments={self.arguments}, name={self.name}, fqName={self.get_fully_qualified_name()}, title={self.title}, description={self.description}, meta={self.meta}]"
 
 T = TypeVar('T')
 F = TypeVar('F')
 
 class Converter(Generic[T, F], abc.ABC):
-    def convert_to_list(self, sources: List[F]) -> List[T]:
+    def convert_to_list(self, sources: list[F]) -> list[T]:
         if sources is None:
             raise ValueError("sources must not be null")
-        return [self.convert_to(s) for s in sources]
+        return list(map(self.convert_to, sources))
 
     @abc.abstractmethod
     def convert_to(self, source: F) -> T:
         pass
 
-    def convert_from_list(self, targets: List[T]) -> List[F]:
+    def convert_from_list(self, targets: list[T]) -> list[F]:
         if targets is None:
             raise ValueError("targets must not be null")
-        return [self.convert_from(s) for s in targets]
+        return list(map(self.convert_from, targets))
 
     @abc.abstractmethod
     def convert_from(self, target: T) -> F:
@@ -447,7 +623,5 @@ class Converter(Generic[T, F], abc.ABC):
 
 U = TypeVar('U')
 
-def convertAll(items: List[T], convertFn: Callable[T,U]) -> List[U]:
-    l = [convertFn(i) for i in items]
-    f = filter(lambda x: x != None, l)
-    return list(f)
+def convertAll(items: list[T], convertFn: Callable[T,U]) -> list[U]:
+    return [c for i in items if (c := convertFn(i)) is not None]
@@ -1,6 +1,6 @@
 from mcp.types import BaseMetadata
 
-from typing import Any, Self
+from typing import Any, Iterator, Self
 from pydantic import ConfigDict, Field
 
 class GroupsExtensionConfig:
@@ -17,10 +17,28 @@ class Group(BaseMetadata):
 
     meta: dict[str, Any] | None = Field(alias="_meta", default=None)
 
-    model_config = ConfigDict(extra="allow")
-    
-    def _get_parent_name(self, sb: str, tg: Self, separator: str) -> str:
-        return self._get_parent_name(sb, self.parent, separator) + separator + tg.name if tg.parent else tg.name
+    # accept meta= from Python callers; "_meta" stays the wire name
+    model_config = ConfigDict(populate_by_name=True)
+
+    def ancestors(self) -> Iterator[Self]:
+        # yields this group first, then each parent up to the root
+        node = self
+        while node is not None:
+            yield node
+            node = node.parent
 
     def get_fully_qualified_name(self, name_separator: str = ".") -> str:
-        return self._get_parent_name("", self, name_separator)
+        # not memoized: parent and name are plain assignable fields, and
+        # checking a cache against them costs more than this walk
+        names = []
+        append = names.append
+        node = self
+        while node is not None:
+            append(node.name)
+            node = node.parent
+        names.reverse()
+        return name_separator.join(names)
+
+    @property
+    def fully_qualified_name(self) -> str:
+        return self.get_fully_qualified_name()
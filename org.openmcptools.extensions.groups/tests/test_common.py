@@ -9,6 +9,10 @@ from common import (
     Prompt,
     Resource,
     AbstractBase,
+    Icon,
+    Annotations,
+    ToolAnnotations,
+    PromptArgument,
     convertAll,
 )
 
@@ -29,6 +33,14 @@ class TestAbstractBase(unittest.TestCase):
         g = Group("root", "/")
         self.assertEqual(g.name_separator, "/")
 
+    def test_base_has_no_fully_qualified_name(self):
+        with self.assertRaises(NotImplementedError):
+            AbstractBase("base").get_fully_qualified_name()
+
+    def test_interns_names(self):
+        name = "".join(["sha", "red"])
+        self.assertIs(Tool(name).name, Group("shared").name)
+
 # =========================================================================
 # Group — hierarchy & fully qualified names
 # =========================================================================
@@ -89,6 +101,22 @@ class TestGroup(unittest.TestCase):
         self.assertEqual(len(root.child_groups), 0)
         self.assertIsNone(child.parent)
 
+    def test_child_collections_preserve_insertion_order(self):
+        root = Group("root")
+        children = [Group(f"c{i}") for i in range(5)]
+        for child in children:
+            root.add_child_group(child)
+        root.remove_child_group(children[2])
+
+        self.assertEqual(root.get_child_groups(), [children[0], children[1], children[3], children[4]])
+
+    def test_returned_child_lists_do_not_alias_the_group(self):
+        group = Group("g")
+        group.add_child_tool(Tool("t"))
+
+        group.get_child_tools().clear()
+        self.assertEqual(len(group.child_tools), 1)
+
     def test_returns_false_when_removing_non_existent_child_group(self):
         root = Group("root")
         other = Group("other")
@@ -201,6 +229,45 @@ class TestGroupResourceRelationship(unittest.TestCase):
         self.assertEqual(len(group.child_resources), 0)
         self.assertEqual(len(resource.parent_groups), 0)
 
+# =========================================================================
+# Group bulk additions
+# =========================================================================
+
+class TestGroupBulkAdd(unittest.TestCase):
+    def test_adds_child_groups_in_bulk(self):
+        root = Group("com")
+        children = [Group("a"), Group("b")]
+
+        self.assertEqual(root.add_child_groups(children), 2)
+        self.assertEqual(root.child_groups, children)
+        self.assertEqual(children[1].get_fully_qualified_name(), "com.b")
+
+    def test_adds_leaves_in_bulk_and_links_parent_group(self):
+        group = Group("g")
+        tools = [Tool(f"t{i}") for i in range(3)]
+        prompts = [Prompt("p")]
+        resources = [Resource("r", "file:///r")]
+
+        self.assertEqual(group.add_child_tools(tools), 3)
+        self.assertEqual(group.add_child_prompts(prompts), 1)
+        self.assertEqual(group.add_child_resources(iter(resources)), 1)
+
+        self.assertEqual(group.child_tools, tools)
+        self.assertEqual(group.child_prompts, prompts)
+        self.assertEqual(group.child_resources, resources)
+        for leaf in tools + prompts + resources:
+            self.assertIn(group, leaf.parent_groups)
+            self.assertEqual(leaf.get_fully_qualified_name(), "g." + leaf.name)
+
+    def test_bulk_add_skips_existing_and_repeated_children(self):
+        group = Group("g")
+        tool = Tool("t")
+        group.add_child_tool(tool)
+
+        self.assertEqual(group.add_child_tools([tool, Tool("u"), tool]), 1)
+        self.assertEqual(len(group.child_tools), 2)
+        self.assertEqual(len(tool.parent_groups), 1)
+
 # =========================================================================
 # AbstractLeaf — shared leaf behavior
 # =========================================================================
@@ -247,6 +314,22 @@ class TestAbstractLeaf(unittest.TestCase):
         group = Group("g")
         self.assertFalse(tool.remove_parent_group(group))
 
+    def test_has_no_parent_groups_until_added(self):
+        tool = Tool("t")
+        self.assertEqual(len(tool.get_parent_groups()), 0)
+        self.assertEqual(tool.get_parent_group_roots(), [])
+        self.assertEqual(tool.get_fully_qualified_name(), "t")
+
+    def test_parent_groups_returns_a_copy(self):
+        group = Group("g")
+        tool = Tool("t")
+        self.assertEqual(tool.get_parent_groups(), [])
+
+        group.add_child_tool(tool)
+        tool.get_parent_groups().clear()
+        tool.parent_groups.append(Group("other"))
+        self.assertEqual(tool.parent_groups, [group])
+
 # =========================================================================
 # Tool
 # =========================================================================
@@ -295,6 +378,28 @@ class TestPrompt(unittest.TestCase):
         self.assertFalse(prompt.add_argument(arg))
         self.assertEqual(len(prompt.arguments), 1)
 
+    def test_arguments_default_to_empty(self):
+        prompt = Prompt("myPrompt")
+        self.assertEqual(len(prompt.get_arguments()), 0)
+        self.assertFalse(prompt.remove_argument(PromptArgument("query")))
+
+    def test_arguments_returns_a_copy(self):
+        prompt = Prompt("myPrompt")
+        prompt.get_arguments().append({"name": "ignored"})
+        self.assertEqual(prompt.arguments, [])
+
+        prompt.add_argument({"name": "x"})
+        prompt.arguments.clear()
+        self.assertEqual(prompt.get_arguments(), [{"name": "x"}])
+
+    def test_removes_an_equal_but_distinct_argument(self):
+        prompt = Prompt("myPrompt")
+
+        self.assertTrue(prompt.add_argument({"name": "x"}))
+        self.assertFalse(prompt.add_argument({"name": "x"}))
+        self.assertTrue(prompt.remove_argument({"name": "x"}))
+        self.assertEqual(len(prompt.arguments), 0)
+
     def test_returns_false_when_removing_non_existent_argument(self):
         prompt = Prompt("myPrompt")
         arg: PromptArgument = {"name": "other"}
@@ -308,7 +413,7 @@ class TestResource(unittest.TestCase):
     def test_stores_optional_URI_size_mimeType_and_annotations(self):
         resource = Resource("doc", "file:///data.json")
         resource.size = 1024
-        resource.mimeType = "application/json"
+        resource.mime_type = "application/json"
         resource.annotations = {
             "audience": [Role.USER],
             "priority": 1,
@@ -317,10 +422,27 @@ class TestResource(unittest.TestCase):
 
         self.assertEqual(resource.uri, "file:///data.json")
         self.assertEqual(resource.size, 1024)
-        self.assertEqual(resource.mimeType, "application/json")
+        self.assertEqual(resource.mime_type, "application/json")
         self.assertEqual(resource.annotations["audience"], [Role.USER])
         self.assertEqual(resource.annotations["priority"], 1)
 
+    def test_accessors_return_their_own_field(self):
+        annotations = Annotations([Role.USER], 0.5)
+        resource = Resource("doc", "file:///data.json", mime_type="application/json", size=1024, annotations=annotations)
+
+        self.assertEqual(resource.get_uri(), "file:///data.json")
+        self.assertEqual(resource.get_mime_type(), "application/json")
+        self.assertEqual(resource.get_size(), 1024)
+        self.assertIs(resource.get_annotations(), annotations)
+
+# =========================================================================
+# Role
+# =========================================================================
+
+class TestRole(unittest.TestCase):
+    def test_every_role_is_truthy(self):
+        self.assertEqual(list(filter(None, [Role.USER, Role.ASSISTANT])), [Role.USER, Role.ASSISTANT])
+
 # =========================================================================
 # convertAll utility
 # =========================================================================
@@ -531,6 +653,69 @@ class TestDeeplyNestedTree(unittest.TestCase):
         self.assertEqual(child.get_fully_qualified_name(), "org.api")
         self.assertEqual(child.get_root(), root2)
 
+    def test_FQN_of_descendants_updates_after_re_parenting_an_ancestor(self):
+        root1 = Group("com")
+        root2 = Group("org")
+        mid = Group("example")
+        leaf = Group("api")
+
+        root1.add_child_group(mid)
+        mid.add_child_group(leaf)
+        self.assertEqual(leaf.get_fully_qualified_name(), "com.example.api")
+
+        root1.remove_child_group(mid)
+        self.assertEqual(leaf.get_fully_qualified_name(), "example.api")
+
+        root2.add_child_group(mid)
+        self.assertEqual(leaf.get_fully_qualified_name(), "org.example.api")
+
+    def test_FQN_updates_after_assigning_parent_directly(self):
+        root = Group("com")
+        child = Group("api")
+        grandchild = Group("v1")
+        child.add_child_group(grandchild)
+        self.assertEqual(grandchild.get_fully_qualified_name(), "api.v1")
+
+        child.parent = root
+        self.assertEqual(child.get_fully_qualified_name(), "com.api")
+        self.assertEqual(grandchild.get_fully_qualified_name(), "com.api.v1")
+
+        child.parent = None
+        self.assertEqual(grandchild.get_fully_qualified_name(), "api.v1")
+
+    def test_FQN_of_descendants_updates_after_re_parenting_a_directly_assigned_ancestor(self):
+        mid = Group("mid")
+        leaf = Group("leaf")
+        leaf.parent = mid
+        self.assertEqual(leaf.get_fully_qualified_name(), "mid.leaf")
+
+        mid.parent = Group("com")
+        self.assertEqual(leaf.get_root().name, "com")
+        self.assertEqual(leaf.get_fully_qualified_name(), "com.mid.leaf")
+
+    def test_assigning_parent_directly_moves_the_group_between_child_groups(self):
+        root1 = Group("com")
+        root2 = Group("org")
+        child = Group("api")
+
+        child.parent = root1
+        self.assertEqual(root1.child_groups, [child])
+
+        child.set_parent(root2)
+        self.assertEqual(root1.child_groups, [])
+        self.assertEqual(root2.child_groups, [child])
+
+        child.parent = None
+        self.assertEqual(root2.child_groups, [])
+
+    def test_FQN_updates_after_set_parent(self):
+        root = Group("com")
+        child = Group("api")
+        self.assertEqual(child.get_fully_qualified_name(), "api")
+
+        child.set_parent(root)
+        self.assertEqual(child.get_fully_qualified_name(), "com.api")
+
 class TestAbstractLeafFailureCases(unittest.TestCase):
     def test_removing_parent_group_from_tool_not_in_that_group_returns_false(self):
         g1 = Group("g1")
@@ -585,7 +770,7 @@ class TestOptionalPropertiesDefault(unittest.TestCase):
         self.assertIsNone(g.title)
         self.assertIsNone(g.description)
         self.assertIsNone(g.meta)
-        self.assertIsNone(g.icons)
+        self.assertEqual(g.icons, ())
 
     def test_Tool_optional_properties_are_None_when_not_set(self):
         t = Tool("t")
@@ -599,6 +784,15 @@ class TestOptionalPropertiesDefault(unittest.TestCase):
         self.assertIsNone(r.mime_type)
         self.assertIsNone(r.annotations)
 
+    def test_list_valued_properties_default_to_empty_tuples(self):
+        self.assertEqual(Icon("icon.png").sizes, ())
+        self.assertEqual(Annotations().audience, ())
+        self.assertEqual(Tool("t").get_icons(), ())
+
+        g = Group("g")
+        g.set_icons(None)
+        self.assertEqual(g.get_icons(), ())
+
 class TestConvertAllEdgeFailureCases(unittest.TestCase):
     def test_filters_out_all_items_when_every_conversion_returns_None(self):
         result = convertAll([1, 2, 3], lambda x: None)
@@ -618,6 +812,70 @@ class TestConvertAllEdgeFailureCases(unittest.TestCase):
         result = convertAll([1, 2, 3, 4], mixed_conv)
         self.assertEqual(result, ["ok:3", "ok:4"])
 
+# =========================================================================
+# Value classes
+# =========================================================================
+
+class TestValueClasses(unittest.TestCase):
+    def test_tool_annotations_accept_hints_in_constructor(self):
+        ta = ToolAnnotations("MyTool", True, False, True, False, True)
+        self.assertEqual(ta.get_title(), "MyTool")
+        self.assertTrue(ta.get_read_only_hint())
+        self.assertFalse(ta.get_destructive_hint())
+        self.assertTrue(ta.get_idempotent_hint())
+        self.assertFalse(ta.get_open_world_hint())
+        self.assertTrue(ta.get_return_direct())
+        self.assertIsNone(ToolAnnotations().get_read_only_hint())
+
+    def test_prompt_argument_validates_name(self):
+        with self.assertRaisesRegex(ValueError, "name must not be null, empty, or blank"):
+            PromptArgument(" ")
+        arg = PromptArgument("query", description="the query")
+        self.assertFalse(arg.is_required())
+        self.assertEqual(arg.get_description(), "the query")
+
+    def test_value_classes_compare_by_identity(self):
+        self.assertNotEqual(Icon("icon.png"), Icon("icon.png"))
+        self.assertEqual(Annotations(None, 0.5).audience, ())
+
+# =========================================================================
+# String representations
+# =========================================================================
+
+class TestStr(unittest.TestCase):
+    def test_group_reports_child_counts(self):
+        root = Group("com")
+        child = Group("api")
+        root.add_child_group(child)
+        root.add_child_tool(Tool("t1"))
+        root.add_child_tool(Tool("t2"))
+
+        text = str(root)
+        self.assertIn("fqName=com,", text)
+        self.assertIn("childGroups=1,", text)
+        self.assertIn("childTools=2,", text)
+        self.assertIn("childPrompts=0,", text)
+        self.assertIn("childResources=0]", text)
+
+    def test_every_model_class_can_be_formatted(self):
+        prompt = Prompt("p", arguments=[PromptArgument("a", True)])
+        for obj in (Group("g"), Tool("t"), prompt, prompt.arguments[0], Resource("r", "file:///r"), Icon("icon.png"), Annotations(), ToolAnnotations()):
+            self.assertIn(" [", str(obj))
+
+# =========================================================================
+# Slotted instance layout
+# =========================================================================
+
+class TestSlots(unittest.TestCase):
+    def test_model_instances_have_no_instance_dict(self):
+        for obj in (Group("g"), Tool("t"), Prompt("p"), Resource("r", "file:///r"), Icon("icon.png"), Annotations(), ToolAnnotations(), PromptArgument("a")):
+            self.assertFalse(hasattr(obj, "__dict__"), type(obj).__name__)
+
+    def test_rejects_unknown_attributes(self):
+        resource = Resource("r", "file:///r")
+        with self.assertRaises(AttributeError):
+            resource.mimeType = "application/json"
+
 if __name__ == "__main__":
     unittest.main()
 
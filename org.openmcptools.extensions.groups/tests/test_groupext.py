@@ -0,0 +1,124 @@
+import unittest
+
+from common import Group
+from converters import ToolGroupConverter
+from groupext import Group as GroupEx
+
+# =========================================================================
+# Fully qualified names
+# =========================================================================
+
+class TestGroupExFullyQualifiedName(unittest.TestCase):
+    def test_root_fully_qualified_name_is_its_name(self):
+        root = GroupEx(name="com")
+        self.assertEqual(root.get_fully_qualified_name(), "com")
+
+    def test_computes_fully_qualified_name_three_levels_deep(self):
+        root = GroupEx(name="com")
+        mid = GroupEx(name="example", parent=root)
+        leaf = GroupEx(name="api", parent=mid)
+
+        self.assertEqual(mid.get_fully_qualified_name(), "com.example")
+        self.assertEqual(leaf.get_fully_qualified_name(), "com.example.api")
+
+    def test_uses_custom_separator(self):
+        root = GroupEx(name="com")
+        leaf = GroupEx(name="api", parent=GroupEx(name="example", parent=root))
+
+        self.assertEqual(leaf.get_fully_qualified_name("/"), "com/example/api")
+        self.assertEqual(leaf.get_fully_qualified_name(), "com.example.api")
+
+    def test_fully_qualified_name_property_uses_default_separator(self):
+        leaf = GroupEx(name="api", parent=GroupEx(name="com"))
+        self.assertEqual(leaf.fully_qualified_name, "com.api")
+
+# =========================================================================
+# Fully qualified names follow changes
+# =========================================================================
+
+class TestGroupExFullyQualifiedNameUpdates(unittest.TestCase):
+    def test_model_copy_with_new_parent_recomputes(self):
+        r = GroupEx(name="r")
+        c = GroupEx(name="c", parent=r)
+        self.assertEqual(c.get_fully_qualified_name(), "r.c")
+
+        moved = c.model_copy(update={"parent": GroupEx(name="o")})
+        self.assertEqual(moved.get_fully_qualified_name(), "o.c")
+        self.assertEqual(c.get_fully_qualified_name(), "r.c")
+
+    def test_descendants_follow_a_renamed_ancestor(self):
+        root = GroupEx(name="com")
+        leaf = GroupEx(name="api", parent=GroupEx(name="example", parent=root))
+        self.assertEqual(leaf.get_fully_qualified_name(), "com.example.api")
+
+        root.name = "org"
+        self.assertEqual(leaf.get_fully_qualified_name(), "org.example.api")
+
+    def test_descendants_follow_a_re_parented_ancestor(self):
+        mid = GroupEx(name="example", parent=GroupEx(name="com"))
+        leaf = GroupEx(name="api", parent=mid)
+        self.assertEqual(leaf.get_fully_qualified_name("/"), "com/example/api")
+
+        mid.parent = GroupEx(name="org")
+        self.assertEqual(leaf.get_fully_qualified_name("/"), "org/example/api")
+
+        mid.parent = None
+        self.assertEqual(leaf.get_fully_qualified_name("/"), "example/api")
+
+# =========================================================================
+# ancestors()
+# =========================================================================
+
+class TestGroupExAncestors(unittest.TestCase):
+    def test_yields_self_then_parents_up_to_the_root(self):
+        root = GroupEx(name="com")
+        mid = GroupEx(name="example", parent=root)
+        leaf = GroupEx(name="api", parent=mid)
+
+        self.assertEqual([g.name for g in leaf.ancestors()], ["api", "example", "com"])
+
+    def test_root_yields_only_itself(self):
+        root = GroupEx(name="com")
+        self.assertEqual(list(root.ancestors()), [root])
+
+# =========================================================================
+# Construction and meta alias
+# =========================================================================
+
+class TestGroupExMeta(unittest.TestCase):
+    def test_accepts_meta_by_field_name(self):
+        g = GroupEx(name="g", meta={"key": "value"})
+        self.assertEqual(g.meta, {"key": "value"})
+
+    def test_accepts_meta_by_alias(self):
+        g = GroupEx.model_validate({"name": "g", "_meta": {"key": "value"}})
+        self.assertEqual(g.meta, {"key": "value"})
+
+    def test_serializes_meta_under_alias(self):
+        g = GroupEx(name="g", meta={"key": "value"})
+        self.assertEqual(g.model_dump(by_alias=True)["_meta"], {"key": "value"})
+
+# =========================================================================
+# ToolGroupConverter
+# =========================================================================
+
+class TestToolGroupConverter(unittest.TestCase):
+    def test_converts_a_nested_common_group(self):
+        com = Group("com", meta={"owner": "me"})
+        example = Group("example", title="Example")
+        api = Group("api", description="The API")
+        com.add_child_group(example)
+        example.add_child_group(api)
+
+        ex = ToolGroupConverter().convert_from(api)
+
+        self.assertIsInstance(ex, GroupEx)
+        self.assertEqual(ex.name, "api")
+        self.assertEqual(ex.description, "The API")
+        self.assertEqual(ex.parent.title, "Example")
+        self.assertEqual(ex.parent.parent.meta, {"owner": "me"})
+        self.assertIsNone(ex.parent.parent.parent)
+        self.assertEqual(ex.get_fully_qualified_name(), "com.example.api")
+
+if __name__ == "__main__":
+    unittest.main()